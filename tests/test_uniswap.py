@@ -9,7 +9,6 @@ from dataclasses import dataclass
 from time import sleep
 
 from web3 import Web3
-from web3.types import Wei
 
 from uniswap import Uniswap
 from uniswap.constants import ETH_ADDRESS
@@ -519,14 +518,6 @@ class TestUniswap(object):
             client.get_price_input(tokens["ETH"], tokens["UNI"], ONE_ETH, fee=None)
         with pytest.raises(InvalidFeeTier):
             client.get_price_output(tokens["ETH"], tokens["UNI"], ONE_ETH, fee=None)
-        with pytest.raises(InvalidFeeTier):
-            client._get_eth_token_output_price(tokens["UNI"], ONE_ETH, fee=None)
-        with pytest.raises(InvalidFeeTier):
-            client._get_token_eth_output_price(tokens["UNI"], Wei(ONE_ETH), fee=None)
-        with pytest.raises(InvalidFeeTier):
-            client._get_token_token_output_price(
-                tokens["UNI"], tokens["ETH"], ONE_ETH, fee=None
-            )
         with pytest.raises(InvalidFeeTier):
             client.make_trade(tokens["ETH"], tokens["UNI"], ONE_ETH, fee=None)
         with pytest.raises(InvalidFeeTier):
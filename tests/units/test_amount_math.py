@@ -0,0 +1,92 @@
+from fractions import Fraction
+
+import pytest
+
+from uniswap.util import _amount_plus_slippage, _v1_amount_in, _v1_amount_out
+
+
+@pytest.mark.parametrize("slippage", [0.0, 0.0001, 0.005, 0.01, 0.1, 0.5])
+@pytest.mark.parametrize("amount", [0, 1, 1_000, 10**18, 123_456_789_012_345])
+def test_amount_plus_slippage_is_exact(amount: int, slippage: float) -> None:
+    # Ground truth: slippage quantized to micro-units, applied as a fraction.
+    micro = int(slippage * 1_000_000)
+    expected = amount * Fraction(1_000_000 + micro, 1_000_000)
+    assert _amount_plus_slippage(amount, slippage) == int(expected)
+
+
+def test_amount_plus_slippage_agrees_with_float_math_when_it_is_exact() -> None:
+    # Where the old float expression doesn't lose precision, the integer
+    # version must agree with it.
+    assert _amount_plus_slippage(1_000, 0.1) == int((1 + 0.1) * 1_000)
+    assert _amount_plus_slippage(12_345, 0.01) == int((1 + 0.01) * 12_345)
+
+
+def test_amount_plus_slippage_fixes_float_rounding() -> None:
+    # 1.005 * 1000 evaluates to 1004.999... in binary floats and used to
+    # truncate to 1004; the integer math yields the exact 1005.
+    assert int((1 + 0.005) * 1_000) == 1_004
+    assert _amount_plus_slippage(1_000, 0.005) == 1_005
+
+
+def test_amount_plus_slippage_exact_above_float_precision() -> None:
+    # Floats lose integer precision above 2**53; the scaled integer division
+    # must stay exact for 256-bit wei amounts.
+    amount = 2**200 + 1
+    assert _amount_plus_slippage(amount, 0.0) == amount
+    assert _amount_plus_slippage(amount, 0.5) == amount * 3 // 2
+
+
+def test_amount_plus_slippage_micro_unit_resolution() -> None:
+    # Slippage is applied at 1e-6 resolution: one micro-unit on 10**6 wei
+    # adds exactly 1, and anything below a micro-unit is truncated.
+    assert _amount_plus_slippage(10**6, 0.000001) == 10**6 + 1
+    assert _amount_plus_slippage(10**6, 0.0000001) == 10**6
+
+
+@pytest.mark.parametrize(
+    ("amount_out", "input_reserve", "output_reserve"),
+    [
+        (1, 10**18, 10**18),
+        (10**18, 5 * 10**20, 3 * 10**21),
+        (123_456_789, 10**24, 10**22),
+    ],
+)
+def test_v1_amount_in_matches_hand_written_formula(
+    amount_out: int, input_reserve: int, output_reserve: int
+) -> None:
+    numerator = amount_out * input_reserve * 1000
+    denominator = (output_reserve - amount_out) * 997
+    assert _v1_amount_in(amount_out, input_reserve, output_reserve) == (
+        numerator // denominator
+    )
+
+
+@pytest.mark.parametrize(
+    ("amount_in", "input_reserve", "output_reserve"),
+    [
+        (1, 10**18, 10**18),
+        (10**18, 5 * 10**20, 3 * 10**21),
+        (123_456_789, 10**24, 10**22),
+    ],
+)
+def test_v1_amount_out_matches_hand_written_formula(
+    amount_in: int, input_reserve: int, output_reserve: int
+) -> None:
+    numerator = amount_in * output_reserve * 997
+    denominator = input_reserve * 1000 + amount_in * 997
+    assert _v1_amount_out(amount_in, input_reserve, output_reserve) == (
+        numerator // denominator
+    )
+
+
+def test_v1_kernels_stay_integral_on_large_reserves() -> None:
+    # Reserve products exceed 2**128; the kernels must not round-trip
+    # through floats.
+    amount = 2**100
+    in_res = 2**120
+    out_res = 2**121
+    out = _v1_amount_out(amount, in_res, out_res)
+    assert isinstance(out, int)
+    # Round-tripping an output through the exact-output cost can't claim a
+    # cheaper input than what was actually sold.
+    assert _v1_amount_in(out, in_res, out_res) <= amount
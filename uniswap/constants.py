@@ -76,6 +76,12 @@ _router_contract_addresses_v2 = {
 
 MAX_UINT_128 = (2**128) - 1
 
+# Max approval (2**256 - 1, i.e. "0x" + "f" * 64) granted to the router/exchange,
+# and the threshold (2**196 - 1, i.e. "0x" + "0" * 15 + "f" * 49) below which
+# we consider re-approval necessary, since the allowance decreases with each trade.
+MAX_APPROVAL_INT = (2**256) - 1
+MAX_APPROVAL_CHECK_INT = (2**196) - 1
+
 # Source: https://github.com/Uniswap/v3-core/blob/v1.0.0/contracts/libraries/TickMath.sol#L8-L11
 MIN_TICK = -887272
 MAX_TICK = -MIN_TICK
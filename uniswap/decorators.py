@@ -3,15 +3,11 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     List,
-    Optional,
     TypeVar,
 )
 
 from typing_extensions import Concatenate, ParamSpec
 
-from .constants import ETH_ADDRESS
-from .types import AddressLike
-
 if TYPE_CHECKING:
     from .uniswap import Uniswap
 
@@ -20,33 +16,6 @@ T = TypeVar("T")
 P = ParamSpec("P")
 
 
-def check_approval(
-    method: Callable[Concatenate["Uniswap", P], T]
-) -> Callable[Concatenate["Uniswap", P], T]:
-    """Decorator to check if user is approved for a token. It approves them if they
-    need to be approved."""
-
-    @functools.wraps(method)
-    def approved(self: "Uniswap", *args: P.args, **kwargs: P.kwargs) -> T:
-        # Check to see if the first token is actually ETH
-        token: Optional[AddressLike] = args[0] if args[0] != ETH_ADDRESS else None  # type: ignore
-        token_two = None
-
-        # Check second token, if needed
-        if method.__name__ == "make_trade" or method.__name__ == "make_trade_output":
-            token_two = args[1] if args[1] != ETH_ADDRESS else None
-
-        # Approve both tokens, if needed
-        if token:
-            is_approved = self._is_approved(token)
-            # logger.warning(f"Approved? {token}: {is_approved}")
-            if not is_approved:
-                self.approve(token)
-        return method(self, *args, **kwargs)
-
-    return approved
-
-
 def supports(
     versions: List[int],
 ) -> Callable[
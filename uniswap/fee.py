@@ -1,15 +1,13 @@
-﻿import enum
+import functools
 import logging
-from typing import final, Final, Optional
+from typing import Dict, Final, Optional
 
 from .exceptions import InvalidFeeTier
 
 logger: Final = logging.getLogger(__name__)
 
 
-@final
-@enum.unique
-class FeeTier(enum.IntEnum):
+class FeeTier(int):
     """
     Available fee tiers represented as 1e-6 percentages (i.e. 0.5% is 5000)
 
@@ -17,26 +15,69 @@ class FeeTier(enum.IntEnum):
     V2 supports only 0.3% fee tier.
     V3 supports 1%, 0.3%, 0.05%, and 0.01% fee tiers.
 
+    Implemented as a plain ``int`` subclass rather than ``enum.IntEnum``:
+    member lookup is a single dict access into ``_value2member_map_``,
+    avoiding the ``EnumMeta.__call__`` machinery on every pricing/trade call.
+
+    Members *are* ints, so pass them to contract calls directly. Don't
+    reintroduce enum-style ``fee.value`` accesses (or ``int(fee)``
+    round-trips) downstream; the member itself is the fast path.
+
     Reference: https://support.uniswap.org/hc/en-us/articles/20904283758349-What-are-fee-tiers
     """
 
-    TIER_100 = 100
-    TIER_500 = 500
-    TIER_3000 = 3000
-    TIER_10000 = 10000
+    __slots__ = ()
+
+    TIER_100: "FeeTier"
+    TIER_500: "FeeTier"
+    TIER_3000: "FeeTier"
+    TIER_10000: "FeeTier"
+
+    _value2member_map_: Dict[int, "FeeTier"]
+
+
+FeeTier.TIER_100 = FeeTier(100)
+FeeTier.TIER_500 = FeeTier(500)
+FeeTier.TIER_3000 = FeeTier(3000)
+FeeTier.TIER_10000 = FeeTier(10000)
+
+FeeTier._value2member_map_ = {
+    100: FeeTier.TIER_100,
+    500: FeeTier.TIER_500,
+    3000: FeeTier.TIER_3000,
+    10000: FeeTier.TIER_10000,
+}
+
+
+# Static message, built once at import time; the dynamic messages below are
+# only formatted on the failure branch, never on the hot success path.
+_EXPLICIT_FEE_TIER_REQUIRED_MSG: Final = """
+            Explicit fee tier is required for Uniswap V3. Refer to the following link for more information:
+            https://support.uniswap.org/hc/en-us/articles/20904283758349-What-are-fee-tiers
+            """
+
+
+def _invalid_fee_tier(fee: object, version: int) -> InvalidFeeTier:
+    return InvalidFeeTier(
+        f"Invalid fee tier {fee} for Uniswap V{version}. Choices are: {FeeTier._value2member_map_.keys()}"
+    )
 
 
 def validate_fee_tier(fee: Optional[int], version: int) -> int:
     """
     Validate fee tier for a given Uniswap version.
     """
+    try:
+        return _validate_fee_tier(fee, version)
+    except TypeError:
+        # Unhashable fees cannot be cached (nor can they be valid tiers).
+        raise _invalid_fee_tier(fee, version)
+
+
+@functools.lru_cache(maxsize=None)
+def _validate_fee_tier(fee: Optional[int], version: int) -> int:
     if version == 3 and fee is None:
-        raise InvalidFeeTier(
-            """
-            Explicit fee tier is required for Uniswap V3. Refer to the following link for more information:
-            https://support.uniswap.org/hc/en-us/articles/20904283758349-What-are-fee-tiers
-            """
-        )
+        raise InvalidFeeTier(_EXPLICIT_FEE_TIER_REQUIRED_MSG)
     if fee is None:
         fee = FeeTier.TIER_3000
 
@@ -44,9 +85,23 @@ def validate_fee_tier(fee: Optional[int], version: int) -> int:
         raise InvalidFeeTier(
             f"Unsupported fee tier {fee} for Uniswap V{version}. Choices are: {FeeTier.TIER_3000}"
         )
-    try:
-        return FeeTier(fee).value
-    except ValueError as exc:
-        raise InvalidFeeTier(
-            f"Invalid fee tier {fee} for Uniswap V{version}. Choices are: {FeeTier._value2member_map_.keys()}"
-        ) from exc
+    member = FeeTier._value2member_map_.get(fee)
+    if member is None:
+        raise _invalid_fee_tier(fee, version)
+    return member
+
+
+# Warm the cache for the handful of (fee, version) pairs seen in practice,
+# so runtime calls on the hot path are a single cache hit.
+for _fee, _version in (
+    (None, 1),
+    (None, 2),
+    (3000, 1),
+    (3000, 2),
+    (100, 3),
+    (500, 3),
+    (3000, 3),
+    (10000, 3),
+):
+    _validate_fee_tier(_fee, _version)
+del _fee, _version
@@ -7,6 +7,10 @@ from .types import AddressLike
 class BaseToken:
     """Base for tokens of all kinds"""
 
+    # Token objects are created in bulk (e.g. _get_all_tokens), so keep them
+    # on __slots__ instead of a per-instance __dict__.
+    __slots__ = ("symbol", "address")
+
     symbol: str
     """Symbol such as ETH, DAI, etc."""
 
@@ -21,6 +25,8 @@ class BaseToken:
 class ERC20Token(BaseToken):
     """Represents an ERC20 token"""
 
+    __slots__ = ("name", "decimals")
+
     name: str
     """Name of the token, as specified in the contract."""
 
@@ -1,15 +1,21 @@
 import functools
 import logging
+import operator
 import os
 import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -20,7 +26,7 @@ from web3 import Web3
 from web3._utils.abi import map_abi_data
 from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.contract import Contract
-from web3.contract.contract import ContractFunction
+from web3.contract.contract import ContractFunction, ContractFunctions
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 from web3.types import (
     Nonce,
@@ -31,6 +37,8 @@ from web3.types import (
 
 from .constants import (
     ETH_ADDRESS,
+    MAX_APPROVAL_CHECK_INT,
+    MAX_APPROVAL_INT,
     MAX_TICK,
     MAX_UINT_128,
     MIN_TICK,
@@ -42,17 +50,22 @@ from .constants import (
     _tick_bitmap_range,
     _tick_spacing,
 )
-from .decorators import check_approval, supports
+from .decorators import supports
 from .exceptions import InsufficientBalance, InvalidToken
 from .fee import validate_fee_tier
 from .token import ERC20Token
+from .tokens import get_tokens
 from .types import AddressLike
 from .util import (
     _addr_to_str,
+    _amount_plus_slippage,
+    _erc20_balance_of,
     _get_eth_simple_cache_middleware,
     _load_contract,
     _load_contract_erc20,
     _str_to_addr,
+    _v1_amount_in,
+    _v1_amount_out,
     _validate_address,
     chunks,
     encode_sqrt_ratioX96,
@@ -63,12 +76,46 @@ from .util import (
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for overlapping independent JSON-RPC reads on the swap paths.
+# Sized small: each swap only ever has a couple of reads in flight at once.
+_rpc_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="uniswap-rpc")
+
 
 class Uniswap:
     """
     Wrapper around Uniswap contracts.
     """
 
+    # Slotted to avoid a per-instance __dict__ and speed up the hundreds of
+    # attribute reads a single trade performs.
+    __slots__ = (
+        "address",
+        "private_key",
+        "version",
+        "w3",
+        "netid",
+        "netname",
+        "default_slippage",
+        "use_estimate_gas",
+        "_last_nonce",
+        "_nonce_refresh_interval",
+        "_last_nonce_refresh",
+        "_current_deadline",
+        "max_approval_int",
+        "max_approval_check_int",
+        "_approved_tokens",
+        "_ex_addr_cache",
+        "_exchange_contract_cache",
+        "_token_cache",
+        "factory_contract",
+        "router_address",
+        "router",
+        "quoter",
+        "positionManager_addr",
+        "nonFungiblePositionManager",
+        "multicall2",
+    )
+
     address: AddressLike
     version: int
 
@@ -134,23 +181,40 @@ class Uniswap:
             self.w3.middleware_onion.inject(_get_eth_simple_cache_middleware(), layer=0)
 
         self.netid = int(self.w3.net.version)
-        if self.netid in _netid_to_name:
-            self.netname = _netid_to_name[self.netid]
-        else:
+        netname = _netid_to_name.get(self.netid)
+        if netname is None:
             raise Exception(f"Unknown netid: {self.netid}")  # pragma: no cover
+        self.netname = netname
         logger.info(f"Using {self.w3} ('{self.netname}', netid: {self.netid})")
 
-        self.last_nonce: Nonce = self.w3.eth.get_transaction_count(self.address)
+        # Fetched lazily on first use; constructing a client should not cost
+        # an RPC round-trip for read-only usage.
+        self._last_nonce: Optional[Nonce] = None
+        # How long (in seconds) the locally tracked nonce is considered
+        # authoritative before re-syncing with the node. Syncing is a full
+        # JSON-RPC round-trip, so we avoid it on every transaction build.
+        self._nonce_refresh_interval: float = 30.0
+        self._last_nonce_refresh: float = time.monotonic()
+        # Set by _deadline_for_batch so a multi-swap sequence shares one deadline.
+        self._current_deadline: Optional[int] = None
 
         # This code automatically approves you for trading on the exchange.
         # max_approval is to allow the contract to exchange on your behalf.
         # max_approval_check checks that current approval is above a reasonable number
         # The program cannot check for max_approval each time because it decreases
         # with each trade.
-        max_approval_hex = f"0x{64 * 'f'}"
-        self.max_approval_int = int(max_approval_hex, 16)
-        max_approval_check_hex = f"0x{15 * '0'}{49 * 'f'}"
-        self.max_approval_check_int = int(max_approval_check_hex, 16)
+        self.max_approval_int = MAX_APPROVAL_INT
+        self.max_approval_check_int = MAX_APPROVAL_CHECK_INT
+        # Tokens this instance has already confirmed (or obtained) approval for.
+        self._approved_tokens: Set[str] = set()
+        # token address -> v1 exchange address, resolved via the factory.
+        self._ex_addr_cache: Dict[AddressLike, AddressLike] = {}
+        # (token address, exchange address) -> v1 exchange Contract.
+        self._exchange_contract_cache: Dict[
+            Tuple[Optional[AddressLike], Optional[AddressLike]], Contract
+        ] = {}
+        # (token address, abi name) -> ERC20Token metadata, which is immutable.
+        self._token_cache: Dict[Tuple[AddressLike, str], ERC20Token] = {}
 
         if self.version == 1:
             if factory_contract_addr is None:
@@ -205,22 +269,24 @@ class Uniswap:
                 abi_name="uniswap-v3/nonFungiblePositionManager",
                 address=self.positionManager_addr,
             )
-            if self.netname == "arbitrum":
-                multicall2_addr = _str_to_addr(
-                    "0x50075F151ABC5B6B448b1272A0a1cFb5CFA25828"
-                )
-            else:
-                multicall2_addr = _str_to_addr(
-                    "0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696"
-                )
-            self.multicall2 = _load_contract(
-                self.w3, abi_name="uniswap-v3/multicall", address=multicall2_addr
-            )
         else:
             raise Exception(
                 f"Invalid version '{self.version}', only 1, 2 or 3 supported"
             )
 
+        # Multicall2 is used to batch read-only calls into a single round-trip,
+        # regardless of the Uniswap version. Loading it is lazy (no RPC).
+        if self.netname == "arbitrum":
+            multicall2_addr = _str_to_addr("0x50075F151ABC5B6B448b1272A0a1cFb5CFA25828")
+        else:
+            multicall2_addr = _str_to_addr("0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696")
+        self.multicall2 = _load_contract(
+            self.w3, abi_name="uniswap-v3/multicall", address=multicall2_addr
+        )
+
+        if enable_caching and self.version == 1:
+            self._warm_exchange_cache()
+
         if hasattr(self, "factory_contract"):
             logger.info(f"Using factory contract: {self.factory_contract}")
 
@@ -237,12 +303,10 @@ class Uniswap:
         """Given `qty` amount of the input `token0`, returns the maximum output amount of output `token1`."""
         fee = validate_fee_tier(fee=fee, version=self.version)
 
-        if token0 == ETH_ADDRESS:
-            return self._get_eth_token_input_price(token1, Wei(qty), fee)
-        elif token1 == ETH_ADDRESS:
-            return self._get_token_eth_input_price(token0, qty, fee)
-        else:
-            return self._get_token_token_input_price(token0, token1, qty, fee, route)
+        dispatch = self._price_input_dispatch[
+            (token0 == ETH_ADDRESS, token1 == ETH_ADDRESS)
+        ]
+        return dispatch(self, token0, token1, qty, fee, route)
 
     def get_price_output(
         self,
@@ -352,10 +416,12 @@ class Uniswap:
         self,
         token: AddressLike,  # output token
         qty: int,
-        fee: Optional[int] = None,
+        fee: int,
     ) -> Wei:
-        """Public price (i.e. amount of ETH needed) for ETH to token trades with an exact output."""
-        fee = validate_fee_tier(fee=fee, version=self.version)
+        """Public price (i.e. amount of ETH needed) for ETH to token trades with an exact output.
+
+        `fee` must already be validated by the public entrypoint (see `validate_fee_tier`).
+        """
         if self.version == 1:
             ex = self._exchange_contract(token)
             price: Wei = ex.functions.getEthToTokenOutputPrice(qty).call()
@@ -373,10 +439,12 @@ class Uniswap:
         return price
 
     def _get_token_eth_output_price(
-        self, token: AddressLike, qty: Wei, fee: Optional[int] = None  # input token
+        self, token: AddressLike, qty: Wei, fee: int  # input token
     ) -> int:
-        """Public price (i.e. amount of input token needed) for token to ETH trades with an exact output."""
-        fee = validate_fee_tier(fee=fee, version=self.version)
+        """Public price (i.e. amount of input token needed) for token to ETH trades with an exact output.
+
+        `fee` must already be validated by the public entrypoint (see `validate_fee_tier`).
+        """
         if self.version == 1:
             ex = self._exchange_contract(token)
             price: int = ex.functions.getTokenToEthOutputPrice(qty).call()
@@ -397,15 +465,17 @@ class Uniswap:
         token0: AddressLike,  # input token
         token1: AddressLike,  # output token
         qty: int,
-        fee: Optional[int] = None,
+        fee: int,
         route: Optional[List[AddressLike]] = None,
     ) -> int:
         """
         Public price (i.e. amount of input token needed) for token to token trades with an exact output.
 
+        `fee` must already be validated by the public entrypoint (see `validate_fee_tier`).
+
         :param fee: (v3 only) The pool's fee in hundredths of a bip, i.e. 1e-6 (3000 is 0.3%)
         """
-        fee = validate_fee_tier(fee=fee, version=self.version)
+        assert fee is not None, "fee must be validated before reaching internal methods"
         if not route:
             if self.version == 2:
                 # If one of the tokens are WETH, delegate to appropriate call.
@@ -438,7 +508,6 @@ class Uniswap:
         return price
 
     # ------ Make Trade ----------------------------------------------------------------
-    @check_approval
     def make_trade(
         self,
         input_token: AddressLike,
@@ -450,8 +519,12 @@ class Uniswap:
         fee_on_transfer: bool = False,
     ) -> HexBytes:
         """Make a trade by defining the qty of the input token."""
-        if not isinstance(qty, int):
-            raise TypeError("swapped quantity must be an integer")
+        self._check_approval(input_token)
+        try:
+            # Fast path for int/Wei; anything non-integral raises TypeError.
+            qty = operator.index(qty)
+        except TypeError:
+            raise TypeError("swapped quantity must be an integer") from None
 
         fee = validate_fee_tier(fee=fee, version=self.version)
 
@@ -461,26 +534,20 @@ class Uniswap:
         if input_token == output_token:
             raise ValueError
 
-        if input_token == ETH_ADDRESS:
-            return self._eth_to_token_swap_input(
-                output_token, Wei(qty), recipient, fee, slippage, fee_on_transfer
-            )
-        elif output_token == ETH_ADDRESS:
-            return self._token_to_eth_swap_input(
-                input_token, qty, recipient, fee, slippage, fee_on_transfer
-            )
-        else:
-            return self._token_to_token_swap_input(
-                input_token,
-                output_token,
-                qty,
-                recipient,
-                fee,
-                slippage,
-                fee_on_transfer,
-            )
+        dispatch = self._make_trade_dispatch[
+            (input_token == ETH_ADDRESS, output_token == ETH_ADDRESS)
+        ]
+        return dispatch(
+            self,
+            input_token,
+            output_token,
+            qty,
+            recipient,
+            fee,
+            slippage,
+            fee_on_transfer,
+        )
 
-    @check_approval
     def make_trade_output(
         self,
         input_token: AddressLike,
@@ -491,6 +558,7 @@ class Uniswap:
         slippage: Optional[float] = None,
     ) -> HexBytes:
         """Make a trade by defining the qty of the output token."""
+        self._check_approval(input_token)
         fee = validate_fee_tier(fee=fee, version=self.version)
 
         if slippage is None:
@@ -500,8 +568,14 @@ class Uniswap:
             raise ValueError
 
         if input_token == ETH_ADDRESS:
-            balance = self.get_eth_balance()
-            need = self._get_eth_token_output_price(output_token, qty, fee)
+            if self.version == 3:
+                # Batch the balance and quote lookups into a single eth_call.
+                balance, need = self._batch_eth_balance_and_output_price(
+                    output_token, qty, fee
+                )
+            else:
+                balance = self.get_eth_balance()
+                need = self._get_eth_token_output_price(output_token, qty, fee)
             if balance < need:
                 raise InsufficientBalance(balance, need)
             return self._eth_to_token_swap_output(
@@ -516,6 +590,149 @@ class Uniswap:
                 input_token, output_token, qty, recipient, fee, slippage
             )
 
+    # Precomputed dispatch tables keyed on (input is ETH, output is ETH),
+    # replacing per-call if/elif chains in get_price_input and make_trade.
+    # The entries are small typed adapter methods rather than lambdas so the
+    # tables stay annotated and the call sites type-check.
+    def _price_input_from_eth(
+        self,
+        token0: AddressLike,
+        token1: AddressLike,
+        qty: int,
+        fee: int,
+        route: Optional[List[AddressLike]],
+    ) -> int:
+        return self._get_eth_token_input_price(token1, Wei(qty), fee)
+
+    def _price_input_to_eth(
+        self,
+        token0: AddressLike,
+        token1: AddressLike,
+        qty: int,
+        fee: int,
+        route: Optional[List[AddressLike]],
+    ) -> int:
+        return self._get_token_eth_input_price(token0, qty, fee)
+
+    def _price_input_token_to_token(
+        self,
+        token0: AddressLike,
+        token1: AddressLike,
+        qty: int,
+        fee: int,
+        route: Optional[List[AddressLike]],
+    ) -> int:
+        return self._get_token_token_input_price(token0, token1, qty, fee, route)
+
+    _price_input_dispatch: Dict[
+        Tuple[bool, bool],
+        Callable[
+            [
+                "Uniswap",
+                AddressLike,
+                AddressLike,
+                int,
+                int,
+                Optional[List[AddressLike]],
+            ],
+            int,
+        ],
+    ] = {
+        (True, False): _price_input_from_eth,
+        (True, True): _price_input_from_eth,
+        (False, True): _price_input_to_eth,
+        (False, False): _price_input_token_to_token,
+    }
+
+    def _make_trade_from_eth(
+        self,
+        input_token: AddressLike,
+        output_token: AddressLike,
+        qty: int,
+        recipient: Optional[AddressLike],
+        fee: int,
+        slippage: float,
+        fee_on_transfer: bool,
+    ) -> HexBytes:
+        return self._eth_to_token_swap_input(
+            output_token, Wei(qty), recipient, fee, slippage, fee_on_transfer
+        )
+
+    def _make_trade_to_eth(
+        self,
+        input_token: AddressLike,
+        output_token: AddressLike,
+        qty: int,
+        recipient: Optional[AddressLike],
+        fee: int,
+        slippage: float,
+        fee_on_transfer: bool,
+    ) -> HexBytes:
+        return self._token_to_eth_swap_input(
+            input_token, qty, recipient, fee, slippage, fee_on_transfer
+        )
+
+    def _make_trade_token_to_token(
+        self,
+        input_token: AddressLike,
+        output_token: AddressLike,
+        qty: int,
+        recipient: Optional[AddressLike],
+        fee: int,
+        slippage: float,
+        fee_on_transfer: bool,
+    ) -> HexBytes:
+        return self._token_to_token_swap_input(
+            input_token, output_token, qty, recipient, fee, slippage, fee_on_transfer
+        )
+
+    _make_trade_dispatch: Dict[
+        Tuple[bool, bool],
+        Callable[
+            [
+                "Uniswap",
+                AddressLike,
+                AddressLike,
+                int,
+                Optional[AddressLike],
+                int,
+                float,
+                bool,
+            ],
+            HexBytes,
+        ],
+    ] = {
+        (True, False): _make_trade_from_eth,
+        (False, True): _make_trade_to_eth,
+        (False, False): _make_trade_token_to_token,
+    }
+
+    def _v1_swap_function(
+        self,
+        token_funcs: ContractFunctions,
+        func_params: List[Any],
+        recipient: Optional[AddressLike],
+        fn_no_recipient: str,
+        fn_with_recipient: str,
+        recipient_index: Optional[int] = None,
+    ) -> ContractFunction:
+        """
+        Build a v1 exchange swap call, selecting the ``*Transfer*`` variant
+        (with the recipient spliced into the params) when a recipient is given.
+
+        Shared by all six v1 swap paths so the swap/transfer branching lives
+        in one place instead of being duplicated per method.
+        """
+        if not recipient:
+            fn: Callable[..., ContractFunction] = getattr(token_funcs, fn_no_recipient)
+            return fn(*func_params)
+        if recipient_index is None:
+            func_params.append(recipient)
+        else:
+            func_params.insert(recipient_index, recipient)
+        fn = getattr(token_funcs, fn_with_recipient)
+        return fn(*func_params)
+
     def _eth_to_token_swap_input(
         self,
         output_token: AddressLike,
@@ -537,11 +754,13 @@ class Uniswap:
             token_funcs = self._exchange_contract(output_token).functions
             tx_params = self._get_tx_params(qty)
             func_params: List[Any] = [qty, self._deadline()]
-            if not recipient:
-                function = token_funcs.ethToTokenSwapInput(*func_params)
-            else:
-                func_params.append(recipient)
-                function = token_funcs.ethToTokenTransferInput(*func_params)
+            function = self._v1_swap_function(
+                token_funcs,
+                func_params,
+                recipient,
+                "ethToTokenSwapInput",
+                "ethToTokenTransferInput",
+            )
             return self._build_and_send_tx(function, tx_params)
 
         elif self.version == 2:
@@ -617,11 +836,13 @@ class Uniswap:
         if self.version == 1:
             token_funcs = self._exchange_contract(input_token).functions
             func_params: List[Any] = [qty, 1, self._deadline()]
-            if not recipient:
-                function = token_funcs.tokenToEthSwapInput(*func_params)
-            else:
-                func_params.append(recipient)
-                function = token_funcs.tokenToEthTransferInput(*func_params)
+            function = self._v1_swap_function(
+                token_funcs,
+                func_params,
+                recipient,
+                "tokenToEthSwapInput",
+                "tokenToEthTransferInput",
+            )
             return self._build_and_send_tx(function)
         elif self.version == 2:
             if recipient is None:
@@ -723,11 +944,14 @@ class Uniswap:
                 self._deadline(),
                 output_token,
             ]
-            if not recipient:
-                function = token_funcs.tokenToTokenSwapInput(*func_params)
-            else:
-                func_params.insert(len(func_params) - 1, recipient)
-                function = token_funcs.tokenToTokenTransferInput(*func_params)
+            function = self._v1_swap_function(
+                token_funcs,
+                func_params,
+                recipient,
+                "tokenToTokenSwapInput",
+                "tokenToTokenTransferInput",
+                recipient_index=len(func_params) - 1,
+            )
             return self._build_and_send_tx(function)
         elif self.version == 2:
             min_tokens_bought = int(
@@ -793,10 +1017,12 @@ class Uniswap:
         if output_token == ETH_ADDRESS:
             raise ValueError
 
-        # Balance check
-        eth_balance = self.get_eth_balance()
+        # Balance check. The balance read is independent of the price quote,
+        # so overlap it with the quote instead of issuing them back to back.
+        balance_future = _rpc_executor.submit(self.get_eth_balance)
         cost = self._get_eth_token_output_price(output_token, qty, fee)
-        amount_in_max = Wei(int((1 + slippage) * cost))
+        eth_balance = balance_future.result()
+        amount_in_max = Wei(_amount_plus_slippage(cost, slippage))
 
         # We check balance against amount_in_max rather than cost to be conservative
         if amount_in_max > eth_balance:
@@ -804,22 +1030,20 @@ class Uniswap:
 
         if self.version == 1:
             token_funcs = self._exchange_contract(output_token).functions
-            eth_qty = self._get_eth_token_output_price(output_token, qty)
-            tx_params = self._get_tx_params(eth_qty)
+            tx_params = self._get_tx_params(Wei(cost))
             func_params: List[Any] = [qty, self._deadline()]
-            if not recipient:
-                function = token_funcs.ethToTokenSwapOutput(*func_params)
-            else:
-                func_params.append(recipient)
-                function = token_funcs.ethToTokenTransferOutput(*func_params)
+            function = self._v1_swap_function(
+                token_funcs,
+                func_params,
+                recipient,
+                "ethToTokenSwapOutput",
+                "ethToTokenTransferOutput",
+            )
             return self._build_and_send_tx(function, tx_params)
         elif self.version == 2:
             if recipient is None:
                 recipient = self.address
-            eth_qty = int(
-                (1 + slippage)
-                * self._get_eth_token_output_price(output_token, qty, fee)
-            )  # type: ignore
+            eth_qty = amount_in_max
             return self._build_and_send_tx(
                 self.router.functions.swapETHForExactTokens(
                     qty,
@@ -873,45 +1097,40 @@ class Uniswap:
         if input_token == ETH_ADDRESS:
             raise ValueError
 
-        # Balance check
-        input_balance = self.get_token_balance(input_token)
+        # Balance check, overlapped with the price quote as above.
+        balance_future = _rpc_executor.submit(self.get_token_balance, input_token)
         cost = self._get_token_eth_output_price(input_token, qty, fee)
-        amount_in_max = int((1 + slippage) * cost)
+        input_balance = balance_future.result()
+        amount_in_max = _amount_plus_slippage(cost, slippage)
 
         # We check balance against amount_in_max rather than cost to be conservative
         if amount_in_max > input_balance:
             raise InsufficientBalance(input_balance, amount_in_max)
 
         if self.version == 1:
-            # From https://uniswap.org/docs/v1/frontend-integration/trade-tokens/
-            # Is all this really necessary? Can't we just use `cost` for max_tokens?
-            outputAmount = qty
-            inputReserve = self.get_ex_token_balance(input_token)
-            outputReserve = self.get_ex_eth_balance(input_token)
-
-            numerator = outputAmount * inputReserve * 1000
-            denominator = (outputReserve - outputAmount) * 997
-            inputAmount = numerator / denominator + 1
-
-            max_tokens = int((1 + slippage) * inputAmount)
+            # `cost` already comes from the exchange's own
+            # getTokenToEthOutputPrice, so reuse it instead of re-deriving the
+            # constant-product math from two extra reserve fetches.
+            max_tokens = amount_in_max
 
             ex = self._exchange_contract(input_token)
             func_params: List[Any] = [qty, max_tokens, self._deadline()]
-            if not recipient:
-                function = ex.functions.tokenToEthSwapOutput(*func_params)
-            else:
-                func_params.append(recipient)
-                function = ex.functions.tokenToEthTransferOutput(*func_params)
+            function = self._v1_swap_function(
+                ex.functions,
+                func_params,
+                recipient,
+                "tokenToEthSwapOutput",
+                "tokenToEthTransferOutput",
+            )
             return self._build_and_send_tx(function)
         elif self.version == 2:
             if recipient is None:
                 recipient = self.address
 
-            max_tokens = int((1 + slippage) * cost)
             return self._build_and_send_tx(
                 self.router.functions.swapTokensForExactETH(
                     qty,
-                    max_tokens,
+                    amount_in_max,
                     [input_token, self.get_weth_address()],
                     recipient,
                     self._deadline(),
@@ -972,7 +1191,7 @@ class Uniswap:
         # Balance check
         input_balance = self.get_token_balance(input_token)
         cost = self._get_token_token_output_price(input_token, output_token, qty, fee)
-        amount_in_max = int((1 + slippage) * cost)
+        amount_in_max = _amount_plus_slippage(cost, slippage)
         if (
             amount_in_max > input_balance
         ):  # We check balance against amount_in_max rather than cost to be conservative
@@ -991,11 +1210,14 @@ class Uniswap:
                 self._deadline(),
                 output_token,
             ]
-            if not recipient:
-                function = token_funcs.tokenToTokenSwapOutput(*func_params)
-            else:
-                func_params.insert(len(func_params) - 1, recipient)
-                function = token_funcs.tokenToTokenTransferOutput(*func_params)
+            function = self._v1_swap_function(
+                token_funcs,
+                func_params,
+                recipient,
+                "tokenToTokenSwapOutput",
+                "tokenToTokenTransferOutput",
+                recipient_index=len(func_params) - 1,
+            )
             return self._build_and_send_tx(function, tx_params)
         elif self.version == 2:
             if recipient is None:
@@ -1003,7 +1225,7 @@ class Uniswap:
             cost = self._get_token_token_output_price(
                 input_token, output_token, qty, fee=fee
             )
-            amount_in_max = int((1 + slippage) * cost)
+            amount_in_max = _amount_plus_slippage(cost, slippage)
             return self._build_and_send_tx(
                 self.router.functions.swapTokensForExactTokens(
                     qty,
@@ -1037,6 +1259,37 @@ class Uniswap:
         else:
             raise ValueError
 
+    @supports([3])
+    def _batch_eth_balance_and_output_price(
+        self, output_token: AddressLike, qty: int, fee: int
+    ) -> Tuple[Wei, Wei]:
+        """
+        Fetch the wallet's ETH balance and the exact-output quote for
+        `output_token` in a single Multicall2 round-trip instead of two
+        sequential RPC calls.
+        """
+        sqrtPriceLimitX96 = 0
+        balance_call = self.multicall2.functions.getEthBalance(
+            _addr_to_str(self.address)
+        )
+        quote_call = self.quoter.functions.quoteExactOutputSingle(
+            self.get_weth_address(), output_token, fee, qty, sqrtPriceLimitX96
+        )
+        results = self.multicall(
+            [
+                (
+                    self.multicall2.address,
+                    HexBytes(balance_call._encode_transaction_data()),
+                ),
+                (
+                    self.quoter.address,
+                    HexBytes(quote_call._encode_transaction_data()),
+                ),
+            ],
+            ["uint256"],
+        )
+        return Wei(results[0][0]), Wei(results[1][0])
+
     # ------ Wallet balance ------------------------------------------------------------
     def get_eth_balance(self) -> Wei:
         """Get the balance of ETH for your address."""
@@ -1047,9 +1300,7 @@ class Uniswap:
         _validate_address(token)
         if _addr_to_str(token) == ETH_ADDRESS:
             return self.get_eth_balance()
-        erc20 = _load_contract_erc20(self.w3, token)
-        balance: int = erc20.functions.balanceOf(self.address).call()
-        return balance
+        return _erc20_balance_of(self.w3, token, self.address)
 
     # ------ ERC20 Pool ----------------------------------------------------------------
     @supports([1])
@@ -1061,43 +1312,78 @@ class Uniswap:
     @supports([1])
     def get_ex_token_balance(self, token: AddressLike) -> int:
         """Get the balance of a token in an exchange contract."""
-        erc20 = _load_contract_erc20(self.w3, token)
-        balance: int = erc20.functions.balanceOf(
-            self._exchange_address_from_token(token)
-        ).call()
-        return balance
+        return _erc20_balance_of(
+            self.w3, token, self._exchange_address_from_token(token)
+        )
+
+    @supports([1])
+    def _get_exchange_reserves(self, *tokens: AddressLike) -> List[Tuple[Wei, int]]:
+        """
+        Fetch the (ETH reserve, token reserve) of each token's exchange
+        contract, batched into a single Multicall2 round-trip instead of two
+        eth_calls per token.
+        """
+        calls = []
+        for token in tokens:
+            ex_addr = self._exchange_address_from_token(token)
+            erc20 = _load_contract_erc20(self.w3, token)
+            calls.append(
+                (
+                    self.multicall2.address,
+                    HexBytes(
+                        self.multicall2.functions.getEthBalance(
+                            ex_addr
+                        )._encode_transaction_data()
+                    ),
+                )
+            )
+            calls.append(
+                (
+                    erc20.address,
+                    HexBytes(
+                        erc20.functions.balanceOf(ex_addr)._encode_transaction_data()
+                    ),
+                )
+            )
+        results = self.multicall(calls, ["uint256"])
+        return [
+            (Wei(results[i][0]), int(results[i + 1][0]))
+            for i in range(0, len(results), 2)
+        ]
 
     # TODO: ADD TOTAL SUPPLY
     @supports([1])
     def get_exchange_rate(self, token: AddressLike) -> float:
         """Get the current ETH/token exchange rate of the token."""
-        eth_reserve = self.get_ex_eth_balance(token)
-        token_reserve = self.get_ex_token_balance(token)
+        ((eth_reserve, token_reserve),) = self._get_exchange_reserves(token)
         return float(token_reserve / eth_reserve)
 
     # ------ Liquidity -----------------------------------------------------------------
     @supports([1])
-    @check_approval
     def add_liquidity(
         self, token: AddressLike, max_eth: Wei, min_liquidity: int = 1
     ) -> HexBytes:
         """Add liquidity to the pool."""
+        self._check_approval(token)
         tx_params = self._get_tx_params(max_eth)
-        # Add 1 to avoid rounding errors, per
+        # Integer math on the raw reserves, rather than going through the
+        # float-returning get_exchange_rate (lossy on 18-decimal reserves).
+        # Add 10 to avoid rounding errors, per
         # https://hackmd.io/hthz9hXKQmSyXfMbPsut1g#Add-Liquidity-Calculations
-        max_token = int(max_eth * self.get_exchange_rate(token)) + 10
+        ((eth_reserve, token_reserve),) = self._get_exchange_reserves(token)
+        max_token = int(max_eth) * token_reserve // eth_reserve + 10
         func_params = [min_liquidity, max_token, self._deadline()]
         function = self._exchange_contract(token).functions.addLiquidity(*func_params)
         return self._build_and_send_tx(function, tx_params)
 
     @supports([1])
-    @check_approval
     def remove_liquidity(self, token: str, max_token: int) -> HexBytes:
         """Remove liquidity from the pool."""
+        self._check_approval(token)
         func_params = [int(max_token), 1, 1, self._deadline()]
-        function = self._exchange_contract(token).functions.removeLiquidity(
-            *func_params
-        )
+        function = self._exchange_contract(
+            _str_to_addr(token)
+        ).functions.removeLiquidity(*func_params)
         return self._build_and_send_tx(function)
 
     @supports([3])
@@ -1406,6 +1692,23 @@ class Uniswap:
         # Add extra sleep to let tx propogate correctly
         time.sleep(1)
 
+    def _check_approval(self, token: Union[AddressLike, str, None]) -> None:
+        """Approve `token` for trading if it isn't already.
+
+        Tokens known to be approved are cached per instance, so repeated
+        trades on the same token skip the allowance RPC entirely.
+        """
+        if token is None or token == ETH_ADDRESS:
+            return
+        # Normalize str spellings so the helpers below get an AddressLike.
+        addr = _str_to_addr(token)
+        key = _addr_to_str(addr)
+        if key == ETH_ADDRESS or key in self._approved_tokens:
+            return
+        if not self._is_approved(addr):
+            self.approve(addr)
+        self._approved_tokens.add(key)
+
     def _is_approved(self, token: AddressLike) -> bool:
         """Check to see if the exchange and token is approved."""
         _validate_address(token)
@@ -1424,9 +1727,52 @@ class Uniswap:
             return False
 
     # ------ Tx Utils ------------------------------------------------------------------
+    @property
+    def last_nonce(self) -> Nonce:
+        """Locally tracked transaction nonce, fetched from the node on first use."""
+        if self._last_nonce is None:
+            self.force_nonce_refresh()
+            assert self._last_nonce is not None
+        return self._last_nonce
+
+    @last_nonce.setter
+    def last_nonce(self, nonce: Nonce) -> None:
+        self._last_nonce = nonce
+
+    def force_nonce_refresh(self) -> None:
+        """Re-sync the locally tracked nonce with the node.
+
+        Call this if transactions were sent from the same wallet outside of
+        this instance; otherwise the nonce is refreshed at most once per
+        `_nonce_refresh_interval`.
+        """
+        onchain = self.w3.eth.get_transaction_count(self.address)
+        if self._last_nonce is None or onchain > self._last_nonce:
+            self._last_nonce = onchain
+        self._last_nonce_refresh = time.monotonic()
+
+    def _get_nonce(self) -> Nonce:
+        if time.monotonic() - self._last_nonce_refresh > self._nonce_refresh_interval:
+            self.force_nonce_refresh()
+        return self.last_nonce
+
     def _deadline(self) -> int:
-        """Get a predefined deadline. 10min by default (same as the Uniswap SDK)."""
-        return int(time.time()) + 10 * 60
+        """Get a predefined deadline. 10min (600s) by default (same as the Uniswap SDK)."""
+        return self._current_deadline or int(time.time()) + 600
+
+    @contextmanager
+    def _deadline_for_batch(self) -> Iterator[int]:
+        """
+        Pin one shared deadline for every transaction built inside the block.
+
+        Swaps that belong to the same strategy step should expire together
+        rather than each getting its own ``time.time()`` reading.
+        """
+        self._current_deadline = deadline = int(time.time()) + 600
+        try:
+            yield deadline
+        finally:
+            self._current_deadline = None
 
     def _build_and_send_tx(
         self, function: ContractFunction, tx_params: Optional[TxParams] = None
@@ -1466,9 +1812,7 @@ class Uniswap:
         params: TxParams = {
             "from": _addr_to_str(self.address),
             "value": value,
-            "nonce": max(
-                self.last_nonce, self.w3.eth.get_transaction_count(self.address)
-            ),
+            "nonce": self._get_nonce(),
         }
 
         if gas:
@@ -1487,27 +1831,21 @@ class Uniswap:
          - https://hackmd.io/hthz9hXKQmSyXfMbPsut1g
          - https://uniswap.org/docs/v1/frontend-integration/trade-tokens/
         """
-        # Buy TokenB with ETH
-        output_amount_b = qty
-        input_reserve_b = self.get_ex_eth_balance(output_token)
-        output_reserve_b = self.get_ex_token_balance(output_token)
+        # All four reserves are fetched in one batched round-trip.
+        (
+            (input_reserve_b, output_reserve_b),
+            (output_reserve_a, input_reserve_a),
+        ) = self._get_exchange_reserves(output_token, input_token)
 
-        # Cost
-        numerator_b = output_amount_b * input_reserve_b * 1000
-        denominator_b = (output_reserve_b - output_amount_b) * 997
-        input_amount_b = numerator_b / denominator_b + 1
+        # Buy TokenB with ETH
+        input_amount_b = _v1_amount_in(qty, input_reserve_b, output_reserve_b) + 1
 
         # Buy ETH with TokenA
-        output_amount_a = input_amount_b
-        input_reserve_a = self.get_ex_token_balance(input_token)
-        output_reserve_a = self.get_ex_eth_balance(input_token)
-
-        # Cost
-        numerator_a = output_amount_a * input_reserve_a * 1000
-        denominator_a = (output_reserve_a - output_amount_a) * 997
-        input_amount_a = numerator_a / denominator_a - 1
+        input_amount_a = (
+            _v1_amount_in(input_amount_b, input_reserve_a, output_reserve_a) - 1
+        )
 
-        return int(input_amount_a), int(1.2 * input_amount_b)
+        return input_amount_a, input_amount_b * 12 // 10
 
     def _calculate_max_output_token(
         self, output_token: AddressLike, qty: int, input_token: AddressLike
@@ -1516,27 +1854,19 @@ class Uniswap:
         For sell orders (exact input), the amount bought (output) is calculated.
         Similar to _calculate_max_input_token, but for an exact input swap.
         """
-        # TokenA (ERC20) to ETH conversion
-        inputAmountA = qty
-        inputReserveA = self.get_ex_token_balance(input_token)
-        outputReserveA = self.get_ex_eth_balance(input_token)
+        # All four reserves are fetched in one batched round-trip.
+        (
+            (outputReserveA, inputReserveA),
+            (outputReserveB, inputReserveB),
+        ) = self._get_exchange_reserves(input_token, output_token)
 
-        # Cost
-        numeratorA = inputAmountA * outputReserveA * 997
-        denominatorA = inputReserveA * 1000 + inputAmountA * 997
-        outputAmountA = numeratorA / denominatorA
+        # TokenA (ERC20) to ETH conversion
+        outputAmountA = _v1_amount_out(qty, inputReserveA, outputReserveA)
 
         # ETH to TokenB conversion
-        inputAmountB = outputAmountA
-        inputReserveB = self.get_ex_token_balance(output_token)
-        outputReserveB = self.get_ex_eth_balance(output_token)
-
-        # Cost
-        numeratorB = inputAmountB * outputReserveB * 997
-        denominatorB = inputReserveB * 1000 + inputAmountB * 997
-        outputAmountB = numeratorB / denominatorB
+        outputAmountB = _v1_amount_out(outputAmountA, inputReserveB, outputReserveB)
 
-        return int(outputAmountB), int(1.2 * outputAmountA)
+        return outputAmountB, outputAmountA * 12 // 10
 
     # ------ Helpers ------------------------------------------------------------
 
@@ -1579,9 +1909,11 @@ class Uniswap:
     def get_token(self, address: AddressLike, abi_name: str = "erc20") -> ERC20Token:
         """
         Retrieves metadata from the ERC20 contract of a given token, like its name, symbol, and decimals.
+
+        ERC20 metadata is immutable, so results are cached per instance
+        (which pins the chain the metadata came from) without keeping the
+        instance itself alive the way lru_cache on a method would.
         """
-        # FIXME: This function should always return the same output for the same input
-        #        and would therefore benefit from caching
         if address == "0x0000000000000000000000000000000000000000":
             # This isn't exactly right, but for all intents and purposes,
             # ETH is treated as a ERC20 by Uniswap.
@@ -1591,25 +1923,62 @@ class Uniswap:
                 symbol="ETH",
                 decimals=18,
             )
+        key = (address, abi_name)
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            return cached
         token_contract = _load_contract(self.w3, abi_name, address=address)
         try:
-            _name = token_contract.functions.name().call()
-            _symbol = token_contract.functions.symbol().call()
-            decimals = token_contract.functions.decimals().call()
+            _name, _symbol, decimals = self._fetch_token_metadata(
+                token_contract, abi_name
+            )
         except Exception as e:
             logger.warning(
                 f"Exception occurred while trying to get token {_addr_to_str(address)}: {e}"
             )
             raise InvalidToken(address)
+        # bytes32-style tokens return raw bytes; decode only in that case
+        # instead of catching the AttributeError a str would raise.
+        name = _name.decode() if isinstance(_name, (bytes, bytearray)) else _name
+        symbol = (
+            _symbol.decode() if isinstance(_symbol, (bytes, bytearray)) else _symbol
+        )
+        token = ERC20Token(symbol, address, name, decimals)
+        self._token_cache[key] = token
+        return token
+
+    def _fetch_token_metadata(
+        self, token_contract: Contract, abi_name: str
+    ) -> Tuple[Any, Any, int]:
+        """
+        Fetch name/symbol/decimals for a token, batched into a single
+        Multicall2 round-trip instead of three sequential eth_calls. Falls
+        back to sequential calls on chains where Multicall2 is not deployed
+        (or if the batched lookup fails for any other reason).
+        """
+        name_call = token_contract.functions.name()
+        symbol_call = token_contract.functions.symbol()
+        decimals_call = token_contract.functions.decimals()
         try:
-            name = _name.decode()
-        except Exception:
-            name = _name
-        try:
-            symbol = _symbol.decode()
+            params = [
+                {
+                    "target": token_contract.address,
+                    "callData": HexBytes(call._encode_transaction_data()),
+                }
+                for call in (name_call, symbol_call, decimals_call)
+            ]
+            results = self.multicall2.functions.tryAggregate(False, params).call()
+            if all(success for success, _ in results):
+                text_type = "bytes32" if abi_name == "erc20b32" else "string"
+                name = self.w3.codec.decode([text_type], results[0][1])[0]
+                symbol = self.w3.codec.decode([text_type], results[1][1])[0]
+                decimals: int = self.w3.codec.decode(["uint8"], results[2][1])[0]
+                return name, symbol, decimals
         except Exception:
-            symbol = _symbol
-        return ERC20Token(symbol, address, name, decimals)
+            logger.debug(
+                "Batched token metadata lookup failed, falling back to sequential calls"
+            )
+        return name_call.call(), symbol_call.call(), decimals_call.call()
 
     @functools.lru_cache()
     @supports([2, 3])
@@ -1937,13 +2306,54 @@ class Uniswap:
 
     @supports([1])
     def _exchange_address_from_token(self, token_addr: AddressLike) -> AddressLike:
-        ex_addr: AddressLike = self.factory_contract.functions.getExchange(
-            token_addr
-        ).call()
+        # Exchange addresses are immutable once created, so cache them and
+        # skip the factory getExchange round-trip on repeat lookups. Keys are
+        # normalized so str and bytes spellings of a token share one entry.
+        key = _str_to_addr(token_addr)
+        ex_addr: Optional[AddressLike] = self._ex_addr_cache.get(key)
+        if ex_addr is None:
+            ex_addr = self.factory_contract.functions.getExchange(token_addr).call()
+            self._ex_addr_cache[key] = ex_addr
         # TODO: What happens if the token doesn't have an exchange/doesn't exist?
         #       Should probably raise an Exception (and test it)
         return ex_addr
 
+    @supports([1])
+    def _warm_exchange_cache(self) -> None:
+        """
+        Prefetch the exchange addresses of this net's well-known tokens in a
+        single Multicall2 round-trip, so the first trade on a common pair hits
+        the in-process cache instead of paying a factory getExchange call.
+        """
+        try:
+            tokens = get_tokens(self.netname)
+        except Exception:
+            # Nets without a known-token table just skip the warmup.
+            return
+        addrs = [addr for addr in tokens.values() if addr != ETH_ADDRESS]
+        if not addrs:
+            return
+        calls = [
+            (
+                self.factory_contract.address,
+                HexBytes(
+                    self.factory_contract.functions.getExchange(
+                        addr
+                    )._encode_transaction_data()
+                ),
+            )
+            for addr in addrs
+        ]
+        try:
+            results = self.multicall(calls, ["address"])
+        except Exception as e:
+            # Warming is best-effort; lookups fall back to per-token calls.
+            logger.debug(f"Exchange cache warmup failed: {e}")
+            return
+        for addr, (ex_addr,) in zip(addrs, results):
+            if int(ex_addr, 16) != 0:
+                self._ex_addr_cache[_str_to_addr(addr)] = ex_addr
+
     @supports([1])
     def _token_address_from_exchange(self, exchange_addr: AddressLike) -> Address:
         token_addr: Address = (
@@ -1953,13 +2363,19 @@ class Uniswap:
         )
         return token_addr
 
-    @functools.lru_cache()
     @supports([1])
     def _exchange_contract(
         self,
         token_addr: Optional[AddressLike] = None,
         ex_addr: Optional[AddressLike] = None,
     ) -> Contract:
+        # Cached per instance rather than with lru_cache on the method, which
+        # would keep every instance it ever saw alive through the function-level
+        # cache (and pay its locking on each hit).
+        key = (token_addr, ex_addr)
+        contract = self._exchange_contract_cache.get(key)
+        if contract is not None:
+            return contract
         if not ex_addr and token_addr:
             ex_addr = self._exchange_address_from_token(token_addr)
         if ex_addr is None:
@@ -1967,6 +2383,7 @@ class Uniswap:
         abi_name = "uniswap-v1/exchange"
         contract = _load_contract(self.w3, abi_name=abi_name, address=ex_addr)
         logger.info(f"Loaded exchange contract {contract} at {contract.address}")
+        self._exchange_contract_cache[key] = contract
         return contract
 
     @supports([1])
@@ -1976,14 +2393,27 @@ class Uniswap:
 
         Note: This is a *very* expensive operation and might therefore not work properly.
         """
-        # FIXME: This is a very expensive operation, would benefit greatly from caching.
         tokenCount = self.factory_contract.functions.tokenCount().call()
-        tokens = []
-        for i in range(tokenCount):
-            address = self.factory_contract.functions.getTokenWithId(i).call()
-            if address == "0x0000000000000000000000000000000000000000":
-                # Token is ETH
-                continue
-            token = self.get_token(address)
-            tokens.append(token)
-        return tokens
+        # getTokenWithId is a pure index lookup, so batch the whole id range
+        # through Multicall2 in chunks instead of one eth_call per id.
+        # The multicall normalizers hand back checksummed address strings.
+        addresses: List[ChecksumAddress] = []
+        for batch in chunks(range(tokenCount), 100):
+            calls = [
+                (
+                    self.factory_contract.address,
+                    HexBytes(
+                        self.factory_contract.functions.getTokenWithId(
+                            i
+                        )._encode_transaction_data()
+                    ),
+                )
+                for i in batch
+            ]
+            addresses.extend(addr for (addr,) in self.multicall(calls, ["address"]))
+        return [
+            self.get_token(address)
+            for address in addresses
+            # Skip ETH, which has no token contract.
+            if address != "0x0000000000000000000000000000000000000000"
+        ]
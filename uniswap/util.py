@@ -4,6 +4,7 @@ import math
 import os
 from typing import (
     Any,
+    Final,
     Generator,
     List,
     Sequence,
@@ -12,11 +13,12 @@ from typing import (
 )
 
 import lru
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import NameNotFound
+from web3.exceptions import BadFunctionCallOutput, NameNotFound
 from web3.middleware.cache import construct_simple_cache_middleware
-from web3.types import Middleware
+from web3.types import Middleware, TxParams
 
 from .constants import (
     MAX_TICK,
@@ -34,8 +36,10 @@ def _get_eth_simple_cache_middleware() -> Middleware:
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def _str_to_addr(s: Union[AddressLike, str]) -> Address:
-    """Idempotent"""
+    """Idempotent. Cached: results are immutable bytes and the same handful
+    of addresses (wallet, router, ETH, traded tokens) recur on every call."""
     if isinstance(s, str):
         if s.startswith("0x"):
             return Address(bytes.fromhex(s[2:]))
@@ -45,19 +49,29 @@ def _str_to_addr(s: Union[AddressLike, str]) -> Address:
         return s
 
 
+@functools.lru_cache(maxsize=4096)
+def _to_checksum_address(a: Union[AddressLike, str]) -> str:
+    """Cached `Web3.to_checksum_address`, which is Keccak-based and relatively costly."""
+    addr: str = Web3.to_checksum_address(a)
+    return addr
+
+
 def _addr_to_str(a: AddressLike) -> str:
     if isinstance(a, bytes):
         # Address or ChecksumAddress
-        addr: str = Web3.to_checksum_address("0x" + bytes(a).hex())
-        return addr
+        return _to_checksum_address("0x" + bytes(a).hex())
     elif isinstance(a, str) and a.startswith("0x"):
-        addr = Web3.to_checksum_address(a)
-        return addr
+        return _to_checksum_address(a)
 
     raise NameNotFound(a)
 
 
 def is_same_address(a1: Union[AddressLike, str], a2: Union[AddressLike, str]) -> bool:
+    # Equal strings/bytes always denote the same address; only fall back to
+    # normalization when the raw comparison is inconclusive (e.g. mixed case
+    # or str vs bytes).
+    if a1 is a2 or a1 == a2:
+        return True
     return _str_to_addr(a1) == _str_to_addr(a2)
 
 
@@ -65,7 +79,10 @@ def _validate_address(a: AddressLike) -> None:
     assert _addr_to_str(a)
 
 
+@functools.lru_cache(maxsize=None)
 def _load_abi(name: str) -> str:
+    """Cached: loading a contract for a new address shouldn't re-read and
+    re-parse the same ABI JSON from disk."""
     path = f"{os.path.dirname(os.path.abspath(__file__))}/assets/"
     with open(os.path.abspath(path + f"{name}.abi")) as f:
         abi: str = json.load(f)
@@ -82,6 +99,29 @@ def _load_contract_erc20(w3: Web3, address: AddressLike) -> Contract:
     return _load_contract(w3, "erc20", address)
 
 
+# The selector is the same for every ERC20, so compute it once at import.
+_BALANCE_OF_SELECTOR: Final = Web3.keccak(text="balanceOf(address)")[:4]
+
+
+def _erc20_balance_of(w3: Web3, token: AddressLike, owner: AddressLike) -> int:
+    """
+    Raw ``balanceOf`` eth_call with hand-rolled ABI encoding/decoding.
+
+    Skips the web3 Contract machinery (ABI lookup, coder construction,
+    per-call keccak of the signature) on the balance-check hot path; the
+    calldata is just the cached selector plus the left-padded owner address.
+    """
+    data = _BALANCE_OF_SELECTOR + bytes(12) + _str_to_addr(owner)
+    params: TxParams = {"to": _to_checksum_address(token), "data": HexBytes(data)}
+    raw = w3.eth.call(params)
+    if not raw:
+        # Same failure mode Contract.call reports for a non-contract target.
+        raise BadFunctionCallOutput(
+            f"balanceOf returned no data; is {_addr_to_str(token)} a contract?"
+        )
+    return int.from_bytes(raw, "big")
+
+
 def _encode_path(token_in: AddressLike, route: List[Tuple[int, AddressLike]]) -> bytes:
     """
     Needed for multi-hop swaps in V3.
@@ -139,6 +179,33 @@ def chunks(arr: Sequence[Any], n: int) -> Generator:
         yield arr[i : i + n]
 
 
+def _amount_plus_slippage(amount: int, slippage: float) -> int:
+    """
+    Scale an integer token amount by (1 + slippage) using integer arithmetic.
+
+    Avoids multiplying a (potentially 256-bit) amount by a float, which both
+    loses precision above 2**53 and pays for float<->int conversions on the
+    hot swap path. Slippage is applied with micro-unit (1e-6) resolution.
+    """
+    return amount * (1_000_000 + int(slippage * 1_000_000)) // 1_000_000
+
+
+def _v1_amount_in(amount_out: int, input_reserve: int, output_reserve: int) -> int:
+    """
+    Floor cost of buying ``amount_out`` from a Uniswap V1 pair (0.3% fee).
+
+    Module-level pure-int kernel: keeps the constant-product math out of the
+    method bodies so quoting loops pay only integer arithmetic, with no float
+    promotion and no attribute lookups.
+    """
+    return amount_out * input_reserve * 1000 // ((output_reserve - amount_out) * 997)
+
+
+def _v1_amount_out(amount_in: int, input_reserve: int, output_reserve: int) -> int:
+    """Floor proceeds of selling ``amount_in`` into a Uniswap V1 pair (0.3% fee)."""
+    return amount_in * output_reserve * 997 // (input_reserve * 1000 + amount_in * 997)
+
+
 def fee_to_fraction(fee: int) -> float:
     return fee / 1000000
 